@@ -1,36 +1,23 @@
 import logging
+import multiprocessing
 import os
+import sys
+import threading
 from collections import defaultdict
-from copy import deepcopy
-from pathlib import Path
+from copy import copy, deepcopy
+from functools import lru_cache
+from importlib.util import find_spec
 from re import compile
 
-from mkdocs import __version__ as mkdocs_version
+from mkdocs import utils
 from mkdocs.commands.build import _build_page, _populate_page
 from mkdocs.config.base import ValidationError
 from mkdocs.config.config_options import Type
+from mkdocs.exceptions import BuildError
 from mkdocs.plugins import BasePlugin
 from mkdocs.structure.files import Files
 from mkdocs.structure.nav import get_navigation
 
-try:
-    from mkdocs.localization import install_translations
-except ImportError:
-    install_translations = None
-
-try:
-    import pkg_resources
-
-    material_dist = pkg_resources.get_distribution("mkdocs-material")
-    material_version = material_dist.version
-    material_languages = [
-        lang.split(".html")[0]
-        for lang in material_dist.resource_listdir("material/partials/languages")
-    ]
-except Exception:
-    material_languages = []
-    material_version = None
-
 log = logging.getLogger("mkdocs.plugins." + __name__)
 
 LUNR_LANGUAGES = [
@@ -55,7 +42,52 @@ LUNR_LANGUAGES = [
     "vi",
 ]
 MKDOCS_THEMES = ["mkdocs", "readthedocs"]
-RE_LOCALE = compile(r"(^[a-z]{2}_[A-Z]{2}$)|(^[a-z]{2}$)")
+RE_LOCALE = compile(r"^([a-z]{2}_[A-Z]{2}|[a-z]{2})$")
+
+
+@lru_cache(maxsize=256)
+def _is_valid_locale(value):
+    return RE_LOCALE.fullmatch(value) is not None
+
+
+@lru_cache(maxsize=None)
+def _get_material_info():
+    """
+    Return the installed mkdocs-material version and its supported languages.
+    """
+    try:
+        try:
+            from importlib.metadata import version
+        except ImportError:  # python < 3.8
+            from importlib_metadata import version
+
+        material_version = version("mkdocs-material")
+        languages_dir = os.path.join(
+            os.path.dirname(find_spec("material").origin), "partials", "languages"
+        )
+        material_languages = [
+            lang.split(".html")[0] for lang in os.listdir(languages_dir)
+        ]
+    except Exception as e:
+        log.debug(f"mkdocs-static-i18n could not find mkdocs-material: {e!r}")
+        return None, []
+    return material_version, material_languages
+
+
+@lru_cache(maxsize=None)
+def _parse_src_path(src_path, languages):
+    """
+    Return the (base path, suffix, language) of a <name>.<language>.<suffix>
+    or <name>.<suffix> src_path, language being None for the latter.
+    """
+    base_path, suffix = os.path.splitext(src_path)
+    if suffix:
+        stem, language = os.path.splitext(base_path)
+        language = language[1:]
+        # only files with exactly two suffixes can be translations
+        if language in languages and "." not in os.path.basename(stem).lstrip("."):
+            return stem, suffix, language
+    return base_path, suffix, None
 
 
 class Locale(Type):
@@ -66,7 +98,7 @@ class Locale(Type):
     """
 
     def _validate_locale(self, value):
-        if not RE_LOCALE.match(value):
+        if not _is_valid_locale(value):
             raise ValidationError(
                 "Language code values must be either ISO-639-1 lower case "
                 "or represented with they territory/region/county codes, "
@@ -95,34 +127,50 @@ class I18nFiles(Files):
 
     locale = None
     translated = False
+    _src_paths = None
+
+    @property
+    def src_paths(self):
+        """
+        Cache the src_paths mapping, it is invalidated on append and remove.
+        """
+        if self._src_paths is None:
+            self._src_paths = {file.src_path: file for file in self._files}
+        return self._src_paths
+
+    def append(self, file):
+        self._src_paths = None
+        super().append(file)
+
+    def remove(self, file):
+        self._src_paths = None
+        super().remove(file)
+
+    def _get_expected_src_paths(self, path):
+        """
+        Return the translated, default language and given versions of path.
+        """
+        base_path, suffix = os.path.splitext(os.path.normpath(path))
+        return (
+            f"{base_path}.{self.locale}{suffix}",
+            f"{base_path}.{self.default_locale}{suffix}",
+            f"{base_path}{suffix}",
+        )
 
     def __contains__(self, path):
         """
         Return a bool stipulating whether or not we found a translated version
         of the given path or the path itself.
         """
-        expected_src_path = Path(path)
-        expected_src_paths = [
-            expected_src_path.with_suffix(f".{self.locale}{expected_src_path.suffix}"),
-            expected_src_path.with_suffix(
-                f".{self.default_locale}{expected_src_path.suffix}"
-            ),
-            expected_src_path,
-        ]
-        return any(filter(lambda s: Path(s) in expected_src_paths, self.src_paths))
+        src_paths = self.src_paths
+        return any(p in src_paths for p in self._get_expected_src_paths(path))
 
     def get_file_from_path(self, path):
         """ Return a File instance with File.src_path equal to path. """
-        expected_src_path = Path(path)
-        expected_src_paths = [
-            expected_src_path.with_suffix(f".{self.locale}{expected_src_path.suffix}"),
-            expected_src_path.with_suffix(
-                f".{self.default_locale}{expected_src_path.suffix}"
-            ),
-            expected_src_path,
-        ]
-        for src_path in filter(lambda s: Path(s) in expected_src_paths, self.src_paths):
-            return self.src_paths.get(os.path.normpath(src_path))
+        src_paths = self.src_paths
+        for expected_src_path in self._get_expected_src_paths(path):
+            if expected_src_path in src_paths:
+                return src_paths[expected_src_path]
 
 
 class I18n(BasePlugin):
@@ -133,6 +181,7 @@ class I18n(BasePlugin):
         ("languages", Locale(dict, required=True)),
         ("material_alternate", Type(bool, default=True, required=False)),
         ("nav_translations", Type(dict, default={}, required=False)),
+        ("parallel_build", Type(bool, default=False, required=False)),
     )
 
     def __init__(self, *args, **kwargs):
@@ -142,203 +191,157 @@ class I18n(BasePlugin):
         self.i18n_navs = {}
         self.material_alternates = None
 
-    def _is_translation_for(self, src_path, language):
-        return Path(src_path).suffixes == [f".{language}", Path(src_path).suffix]
-
     @staticmethod
     def _is_url(value):
         return value.startswith("http://") or value.startswith("https://")
 
-    def _get_translated_page(self, page, language, config):
+    def _get_translated_page(self, page, page_lang, language):
         # there is a specific translation file for this lang
-        for lang in self.all_languages:
-            if self._is_translation_for(page.src_path, lang):
-                i18n_page = self._get_i18n_page(page, lang, config)
-                break
+        if page_lang is not None:
+            i18n_page = self._get_i18n_page(page, page_lang)
         else:
-            i18n_page = deepcopy(page)
+            i18n_page = copy(page)
 
         # setup and copy the file to the current language path
-        i18n_page.dest_path = Path(f"/{language}/{i18n_page.dest_path}")
-        i18n_page.abs_dest_path = Path(f"{config['site_dir']}/{i18n_page.dest_path}")
+        self._set_dest_path(i18n_page, os.path.join(language, i18n_page.dest_path))
         i18n_page.url = (
             f"{language}/" if i18n_page.url == "." else f"{language}/{i18n_page.url}"
         )
 
         return i18n_page
 
-    def _get_translated_asset(self, page, language, config, suffix):
+    def _get_translated_asset(self, page, page_lang, language, suffix):
         # there is a specific translation file for this lang
-        for lang in self.all_languages:
-            if self._is_translation_for(page.src_path, lang):
-                i18n_page = self._get_i18n_asset(page, lang, config, suffix)
-                break
-        else:
+        if page_lang is None:
             return page
+        i18n_page = self._get_i18n_asset(page, page_lang, suffix)
 
         # setup and copy the file to the current language path
-        i18n_page.dest_path = Path(f"/{language}/{i18n_page.dest_path}")
-        i18n_page.abs_dest_path = Path(f"{config['site_dir']}/{i18n_page.dest_path}")
+        self._set_dest_path(i18n_page, os.path.join(language, i18n_page.dest_path))
         i18n_page.url = (
             f"{language}/" if i18n_page.url == "." else f"{language}/{i18n_page.url}"
         )
 
         return i18n_page
 
-    def _get_i18n_page(self, page, page_lang, config):
-        i18n_page = deepcopy(page)
-        i18n_page.abs_dest_path = Path(i18n_page.abs_dest_path)
-        i18n_page.dest_path = Path(i18n_page.dest_path)
-        i18n_page.name = str(Path(page.name).stem)
-        if config.get("use_directory_urls") is False:
-            i18n_page.dest_path = i18n_page.dest_path.with_name(
-                i18n_page.name
-            ).with_suffix(".html")
-            i18n_page.abs_dest_path = i18n_page.abs_dest_path.with_name(
-                i18n_page.name
-            ).with_suffix(".html")
+    def _set_dest_path(self, page, dest_path):
+        page.dest_path = dest_path
+        page.abs_dest_path = os.path.normpath(os.path.join(self.site_dir, dest_path))
+
+    def _get_i18n_page(self, page, page_lang):
+        i18n_page = copy(page)
+        i18n_page.name = os.path.basename(page._i18n_base_path)
+        dest_dir, dest_name = os.path.split(page.dest_path)
+        if self.use_directory_urls is False:
+            dest_path = os.path.join(dest_dir, f"{i18n_page.name}.html")
             i18n_page.url = page.url.replace(page.name, i18n_page.name) or "."
         else:
             # index and readme files do not exhibit a named folder
             # whereas named files do!
             if i18n_page.name == "index" or i18n_page.name == "README":
-                i18n_page.dest_path = i18n_page.dest_path.parent.with_suffix(".html")
-                i18n_page.abs_dest_path = i18n_page.abs_dest_path.parent.with_suffix(
-                    ".html"
-                )
-                i18n_page.url = str(Path(i18n_page.dest_path).parent.as_posix()) + "/"
-                if i18n_page.url == "./":
-                    i18n_page.url = "."
+                dest_path = f"{os.path.splitext(dest_dir)[0]}.html"
             else:
-                i18n_page.dest_path = i18n_page.dest_path.parent.with_suffix(
-                    ""
-                ).joinpath(i18n_page.dest_path.name)
-                i18n_page.abs_dest_path = i18n_page.abs_dest_path.parent.with_suffix(
-                    ""
-                ).joinpath(i18n_page.abs_dest_path.name)
-                i18n_page.url = str(Path(i18n_page.dest_path).parent.as_posix()) + "/"
+                dest_path = os.path.join(os.path.splitext(dest_dir)[0], dest_name)
+            url_dir = os.path.dirname(dest_path).replace(os.sep, "/")
+            i18n_page.url = f"{url_dir}/" if url_dir else "."
 
         # treat README as index, see #63
         if i18n_page.name == "README":
-            try:
-                i18n_page.dest_path = i18n_page.dest_path.with_stem("index")
-                i18n_page.abs_dest_path = i18n_page.abs_dest_path.with_stem("index")
-            except AttributeError:
-                # python3.6 does not have with_stem()
-                i18n_page.dest_path = Path(
-                    str(i18n_page.dest_path).replace("README", "index")
-                )
-                i18n_page.abs_dest_path = Path(
-                    str(i18n_page.abs_dest_path).replace("README", "index")
-                )
+            dest_dir, dest_name = os.path.split(dest_path)
+            dest_path = os.path.join(dest_dir, "index" + os.path.splitext(dest_name)[1])
 
+        self._set_dest_path(i18n_page, dest_path)
         return i18n_page
 
-    def _get_i18n_asset(self, page, page_lang, config, suffix):
-        i18n_page = deepcopy(page)
-        i18n_page.abs_dest_path = Path(i18n_page.abs_dest_path)
-        i18n_page.dest_path = Path(i18n_page.dest_path)
-        i18n_page.name = str(Path(page.name).stem)
-        # root folder assets
-        if i18n_page.dest_path.parent == Path("."):
-            i18n_page.dest_path = Path(f"{i18n_page.name}{suffix}")
-            i18n_page.abs_dest_path = Path(
-                f"{i18n_page.abs_dest_path.parent}/{i18n_page.dest_path}"
-            )
-        else:
-            i18n_page.dest_path = i18n_page.dest_path.parent.with_suffix("").joinpath(
-                f"{i18n_page.name}{suffix}"
-            )
-            i18n_page.abs_dest_path = i18n_page.abs_dest_path.parent.with_suffix(
-                ""
-            ).joinpath(f"{i18n_page.name}{suffix}")
-        i18n_page.url = str(Path(i18n_page.dest_path).as_posix())
-
+    def _get_i18n_asset(self, page, page_lang, suffix):
+        i18n_page = copy(page)
+        i18n_page.name = os.path.basename(page._i18n_base_path)
+        dest_path = os.path.join(
+            os.path.dirname(page.dest_path), f"{i18n_page.name}{suffix}"
+        )
+        i18n_page.url = dest_path.replace(os.sep, "/")
+        self._set_dest_path(i18n_page, dest_path)
         return i18n_page
 
     def _get_page_lang(self, page):
-        for language in self.all_languages:
-            if Path(page.src_path).suffixes == [
-                f".{language}",
-                Path(page.src_path).suffix,
-            ]:
-                return language
-        return None
-
-    def _get_page_from_paths(self, expected_paths, files, version):
-        for expected_path in expected_paths:
-            for page in files:
-                if Path(page.src_path) == expected_path:
-                    return page
+        return page._i18n_lang
+
+    def _get_page_from_languages(
+        self, languages, lang_files, base_path, suffix, version
+    ):
+        for language in languages:
+            page = lang_files.get(language)
+            if page is not None:
+                return page
         else:
+            expected_paths = [
+                f"{base_path}.{lang}{suffix}" if lang else f"{base_path}{suffix}"
+                for lang in languages
+            ]
             log.debug(
                 "mkdocs-static-i18n could not find any of those files for the "
                 f"'{version}' version: {set(expected_paths)}"
             )
 
-    def _dict_replace_value(self, directory, old, new):
-        """
-        Return a copy of the given dict with value replaced.
-        """
-        x = {}
-        for k, v in directory.items():
-            if isinstance(v, dict):
-                v = self._dict_replace_value(v, old, new)
-            elif isinstance(v, list):
-                v = self._list_replace_value(v, old, new)
-            elif isinstance(v, str) or isinstance(v, Path):
-                if str(v) == str(old):
-                    v = new
-                if not self._is_url(v):
-                    v = str(Path(v))
-            x[k] = v
-        return x
-
-    def _list_replace_value(self, listing, old, new):
-        """
-        Return a copy of the given list with value replaced.
-        """
-        x = []
-        for e in listing:
-            if isinstance(e, list):
-                e = self._list_replace_value(e, old, new)
-            elif isinstance(e, dict):
-                e = self._dict_replace_value(e, old, new)
-            elif isinstance(e, str) or isinstance(e, Path):
-                if str(e) == str(old):
-                    e = new
-                if not self._is_url(e):
-                    e = str(Path(e))
-            x.append(e)
-        return x
+    def _index_nav_leaves(self, nav):
+        """
+        Return a mapping of the paths found in the given navigation to the
+        list of (container, key) positions where they appear.
+
+        Non URL paths are indexed on their normalized form, the navigation
+        itself is left untouched.
+        """
+        index = defaultdict(list)
+        stack = [nav]
+        while stack:
+            container = stack.pop()
+            if isinstance(container, dict):
+                items = container.items()
+            else:
+                items = enumerate(container)
+            for key, value in items:
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+                elif isinstance(value, str):
+                    if not self._is_url(value):
+                        value = os.path.normpath(value)
+                    index[value].append((container, key))
+        return index
 
     def _get_base_path(self, page):
         """
         Return the path of the given page without any suffix.
         """
-        page_lang = self._get_page_lang(page)
-        if page_lang is None:
-            base_path = Path(page.src_path).with_suffix("")
-        else:
-            base_path = Path(page.src_path).with_suffix("").with_suffix("")
-        return base_path
+        return page._i18n_base_path
+
+    def _set_i18n_attributes(self, fileobj):
+        """
+        Parse the src_path of the given file once and store its base path,
+        suffix and language on it for the other helpers to use.
+        """
+        (
+            fileobj._i18n_base_path,
+            fileobj._i18n_suffix,
+            fileobj._i18n_lang,
+        ) = _parse_src_path(fileobj.src_path, self.all_languages)
 
     def on_config(self, config, **kwargs):
         """
         Enrich configuration with language specific knowledge.
         """
         self.default_language = self.config["default_language"]
-        self.all_languages = set(
+        self.site_dir = config["site_dir"]
+        self.use_directory_urls = config.get("use_directory_urls")
+        self.all_languages = frozenset(
             [self.default_language] + list(self.config["languages"])
         )
         # Set theme locale to default language
         if self.default_language != "en":
             if config["theme"].name in MKDOCS_THEMES:
-                if mkdocs_version >= "1.2":
-                    config["theme"]["locale"] = self.default_language
-                    log.info(
-                        f"Setting the default 'theme.locale' option to '{self.default_language}'"
-                    )
+                config["theme"]["locale"] = self.default_language
+                log.info(
+                    f"Setting the default 'theme.locale' option to '{self.default_language}'"
+                )
             elif config["theme"].name == "material":
                 config["theme"].language = self.default_language
                 log.info(
@@ -349,12 +352,13 @@ class I18n(BasePlugin):
             return config
         # Support for mkdocs-material>=7.1.0 language selector
         if self.config["material_alternate"] and len(self.all_languages) > 1:
+            material_version, _ = _get_material_info()
             if material_version and material_version >= "7.1.0":
                 if not config["extra"].get("alternate") or kwargs.get("force"):
                     # Add index.html file name when used with
                     # use_directory_urls = True
                     link_suffix = ""
-                    if config.get("use_directory_urls") is False:
+                    if self.use_directory_urls is False:
                         link_suffix = "index.html"
                     config["extra"]["alternate"] = [
                         {
@@ -391,7 +395,15 @@ class I18n(BasePlugin):
                         "compatible with theme.features = navigation.instant"
                     )
                 else:
-                    self.material_alternates = config["extra"].get("alternate")
+                    # store the alternates with their link ready to be
+                    # suffixed by the current page url
+                    self.material_alternates = [
+                        {
+                            **alternate,
+                            "link": self._get_alternate_link_prefix(alternate["link"]),
+                        }
+                        for alternate in config["extra"].get("alternate") or []
+                    ]
         # Support for the search plugin lang
         if "search" in config["plugins"]:
             search_langs = config["plugins"]["search"].config["lang"] or []
@@ -436,32 +448,40 @@ class I18n(BasePlugin):
         main_files.default_locale = self.default_language
         main_files.locale = self.default_language
         for language in self.all_languages:
-            self.i18n_configs[language] = deepcopy(config)
+            # only copy the config keys that are modified per language, the
+            # plugins are shared since there can be only one instance of the
+            # search plugin because it is hardcoded in the JS worker sources
+            i18n_config = config.copy()
+            i18n_config["extra"] = config["extra"].copy()
+            i18n_config["nav"] = deepcopy(config["nav"])
+            i18n_config["theme"] = copy(config["theme"])
+            self.i18n_configs[language] = i18n_config
             self.i18n_files[language] = I18nFiles([])
             self.i18n_files[language].default_locale = self.default_language
             self.i18n_files[language].locale = language
-            # there can be only one instance of the search plugin because
-            # it is hardcoded in the JS worker sources
-            if "search" in config["plugins"]:
-                self.i18n_configs[language]["plugins"]["search"] = config["plugins"][
-                    "search"
-                ]
 
-        base_paths = set()
+        # group the files sharing the same base path and suffix by language
+        files_by_base_path = defaultdict(dict)
         for fileobj in files:
-            base_path = self._get_base_path(fileobj)
-            suffix = Path(fileobj.src_path).suffix
+            self._set_i18n_attributes(fileobj)
+            files_by_base_path[(fileobj._i18n_base_path, fileobj._i18n_suffix)][
+                fileobj._i18n_lang
+            ] = fileobj
 
-            if f"{base_path}{suffix}" in base_paths:
-                continue
+        documentation_pages = {id(f) for f in files.documentation_pages()}
+
+        for (base_path, suffix), lang_files in files_by_base_path.items():
+            # the first file of the group is used to tell its kind
+            fileobj = next(iter(lang_files.values()))
+            is_documentation_page = id(fileobj) in documentation_pages
 
             # main expects .md or .default_language.md
-            main_expects = [
-                Path(f"{base_path}{suffix}"),
-                Path(f"{base_path}.{self.default_language}{suffix}"),
-            ]
-            main_page = self._get_page_from_paths(
-                main_expects, files, version="default"
+            main_page = self._get_page_from_languages(
+                [None, self.default_language],
+                lang_files,
+                base_path,
+                suffix,
+                version="default",
             )
 
             if main_page is not None:
@@ -470,15 +490,13 @@ class I18n(BasePlugin):
                 if page_lang is None:
                     main_files.append(main_page)
                 else:
-                    if fileobj in files.documentation_pages():
+                    if is_documentation_page:
                         # .md documentation files
-                        main_files.append(
-                            self._get_i18n_page(main_page, page_lang, config)
-                        )
+                        main_files.append(self._get_i18n_page(main_page, page_lang))
                     else:
                         # any other .<language>.<suffix> files
                         main_files.append(
-                            self._get_i18n_asset(main_page, page_lang, config, suffix)
+                            self._get_i18n_asset(main_page, page_lang, suffix)
                         )
 
             # skip language builds requested?
@@ -486,31 +504,30 @@ class I18n(BasePlugin):
                 continue
 
             for language in self.all_languages:
-                lang_expects = [
-                    Path(f"{base_path}.{language}{suffix}"),
-                    Path(f"{base_path}.{self.default_language}{suffix}"),
-                    Path(f"{base_path}{suffix}"),
-                ]
-                lang_page = self._get_page_from_paths(
-                    lang_expects, files, version=language
+                lang_page = self._get_page_from_languages(
+                    [language, self.default_language, None],
+                    lang_files,
+                    base_path,
+                    suffix,
+                    version=language,
                 )
                 if lang_page is None:
                     continue
 
                 page_lang = self._get_page_lang(lang_page)
-                if fileobj in files.documentation_pages():
+                if is_documentation_page:
                     # .md documentation files
                     self.i18n_files[language].append(
-                        self._get_translated_page(lang_page, language, config)
+                        self._get_translated_page(lang_page, page_lang, language)
                     )
                 else:
                     # any other .<language>.<suffix> files
                     self.i18n_files[language].append(
-                        self._get_translated_asset(lang_page, language, config, suffix)
+                        self._get_translated_asset(
+                            lang_page, page_lang, language, suffix
+                        )
                     )
 
-                base_paths.add(f"{base_path}{suffix}")
-
         # these comments are here to help me debug later if needed
         # print([{p.src_path: p.url} for p in main_files.documentation_pages()])
         # print([{p.src_path: p.url} for p in self.i18n_files["en"].documentation_pages()])
@@ -530,19 +547,24 @@ class I18n(BasePlugin):
         This function localizes the given pages to their translated
         counterparts if available.
         """
+        nav_index = None
         for i18n_page in files.documentation_pages():
-            if Path(i18n_page.src_path).suffixes == [f".{language}", ".md"]:
+            if (
+                i18n_page._i18n_suffix == ".md"
+                and self._get_page_lang(i18n_page) == language
+            ):
+                if nav_index is None:
+                    nav_index = self._index_nav_leaves(
+                        self.i18n_configs[language]["nav"]
+                    )
                 base_path = self._get_base_path(i18n_page)
                 config_path_expects = [
-                    base_path.with_suffix(".md"),
-                    base_path.with_suffix(f".{self.default_language}.md"),
+                    f"{base_path}.md",
+                    f"{base_path}.{self.default_language}.md",
                 ]
                 for config_path in config_path_expects:
-                    self.i18n_configs[language]["nav"] = self._list_replace_value(
-                        self.i18n_configs[language]["nav"],
-                        config_path,
-                        i18n_page.src_path,
-                    )
+                    for container, key in nav_index.get(config_path, []):
+                        container[key] = i18n_page.src_path
 
     def _translate_navigation(self, language, nav):
         translated_nav = self.config["nav_translations"].get(language, {})
@@ -576,18 +598,45 @@ class I18n(BasePlugin):
         When this happens, we favor the default language location if its
         content is the same as its /language counterpart.
         """
-        entries = deepcopy(search_plugin.search_index._entries)
+        entries = search_plugin.search_index._entries
+        # index the entries by every location form a /language entry can match
+        entries_by_location = defaultdict(list)
         for entry in entries:
-            if entry["location"].startswith(f"{language}/"):
-                for s_entry in search_plugin.search_index._entries:
-                    expected_locations = [
-                        f"{language}/{s_entry['location']}",
-                        f"{language}/{s_entry['location'].rstrip('/')}",
-                        f"{language}/{s_entry['location'].replace('/#', '#')}",
-                    ]
-                    if entry["location"] in expected_locations:
-                        if entry["text"] == s_entry["text"]:
-                            search_plugin.search_index._entries.remove(entry)
+            location = entry["location"]
+            for expected_location in {
+                location,
+                location.rstrip("/"),
+                location.replace("/#", "#"),
+            }:
+                entries_by_location[expected_location].append(entry)
+
+        prefix = f"{language}/"
+        duplicates = set()
+        for entry in entries:
+            if not entry["location"].startswith(prefix):
+                continue
+            location = entry["location"][len(prefix) :]
+            if any(
+                s_entry["text"] == entry["text"]
+                for s_entry in entries_by_location.get(location, [])
+            ):
+                duplicates.add(id(entry))
+
+        search_plugin.search_index._entries = [
+            entry for entry in entries if id(entry) not in duplicates
+        ]
+
+    def _get_alternate_link_prefix(self, link):
+        """
+        Return the given alternate link ready to be suffixed by a page url.
+        """
+        if link.endswith("/"):
+            separator = ""
+        else:
+            separator = "/"
+        if self.use_directory_urls is False:
+            link = link.replace("/index.html", "", 1)
+        return f"{link}{separator}"
 
     def on_page_context(self, context, page, config, nav):
         """
@@ -598,24 +647,15 @@ class I18n(BasePlugin):
         if not self.material_alternates:
             return
 
-        alternates = deepcopy(self.material_alternates)
         page_url = page.url
-        for language in self.all_languages:
-            if page.url.startswith(f"{language}/"):
-                prefix_len = len(language) + 1
-                page_url = page.url[prefix_len:]
-                break
-
-        for alternate in alternates:
-            if alternate["link"].endswith("/"):
-                separator = ""
-            else:
-                separator = "/"
-            if config.get("use_directory_urls") is False:
-                alternate["link"] = alternate["link"].replace("/index.html", "", 1)
-            alternate["link"] += f"{separator}{page_url}"
+        page_url_parts = page_url.split("/", 1)
+        if len(page_url_parts) == 2 and page_url_parts[0] in self.all_languages:
+            page_url = page_url_parts[1]
 
-        config["extra"]["alternate"] = alternates
+        config["extra"]["alternate"] = [
+            {**alternate, "link": f"{alternate['link']}{page_url}"}
+            for alternate in self.material_alternates
+        ]
 
     def on_post_build(self, config):
         """
@@ -627,60 +667,173 @@ class I18n(BasePlugin):
         if self.config["default_language_only"] is True:
             return
 
-        dirty = False
+        languages = list(self.config["languages"])
         search_plugin = config["plugins"].get("search")
-        for language in self.config["languages"]:
-            log.info(f"Building {language} documentation")
+        if self.config["parallel_build"] and len(languages) > 1:
+            if not sys.platform.startswith("linux"):
+                log.info(
+                    "Ignoring 'parallel_build' option: forking processes is "
+                    "only safe on Linux"
+                )
+            elif threading.active_count() > 1:
+                # forking while other threads hold locks can deadlock, this is
+                # the case of the live reload server of 'mkdocs serve'
+                log.info("Ignoring 'parallel_build' option: other threads are running")
+            else:
+                self._build_languages_in_parallel(languages, search_plugin)
+                return
 
-            if self.i18n_configs[language]["nav"]:
-                self._fix_config_navigation(language, self.i18n_files[language])
+        for language in languages:
+            nav = self._prepare_language(language)
+            self._build_language(language, nav)
+            if search_plugin:
+                self._update_search_index(search_plugin, [language])
 
-            self.i18n_navs[language] = get_navigation(
-                self.i18n_files[language], self.i18n_configs[language]
-            )
+    def _build_languages_in_parallel(self, languages, search_plugin):
+        """
+        Build every language in its own forked process.
+
+        The navigations are prepared here so that self.i18n_navs and the
+        File.page objects stay available, but the pages are only populated
+        and rendered in the forked processes: the pages of self.i18n_navs
+        are left unpopulated (no content and no title unless the nav has one).
+        The processes send back the search index entries and the log counts
+        they added, every other state change is lost with the process.
+        """
+        navs = {language: self._prepare_language(language) for language in languages}
+        context = multiprocessing.get_context("fork")
+        results = {}
+        max_processes = os.cpu_count() or 1
+        for i in range(0, len(languages), max_processes):
+            workers = []
+            try:
+                for language in languages[i : i + max_processes]:
+                    reader, writer = context.Pipe(duplex=False)
+                    process = context.Process(
+                        target=self._build_language_process,
+                        args=(language, navs[language], writer),
+                    )
+                    try:
+                        process.start()
+                    except Exception:
+                        reader.close()
+                        raise
+                    finally:
+                        writer.close()
+                    workers.append((language, process, reader))
+                for language, process, reader in workers:
+                    try:
+                        results[language] = reader.recv()
+                    except EOFError:
+                        results[language] = None
+                    process.join()
+                    if process.exitcode != 0 or results[language] is None:
+                        raise BuildError(
+                            f"Failed to build the {language} documentation"
+                        )
+            finally:
+                # do not leave processes writing to site_dir behind on failure
+                for _, process, reader in workers:
+                    if process.is_alive():
+                        process.terminate()
+                    process.join()
+                    reader.close()
+
+        for language in languages:
+            entries, counts = results[language]
+            for level, count in counts.items():
+                utils.log_counter.counts[level] += count
+            if search_plugin:
+                search_plugin.search_index._entries.extend(entries)
+        if search_plugin:
+            self._update_search_index(search_plugin, languages)
 
-            config = self.i18n_configs[language]
-            env = self.i18n_configs[language]["theme"].get_env()
-            files = self.i18n_files[language]
-            nav = self.i18n_navs[language]
+    def _build_language_process(self, language, nav, connection):
+        """
+        Build the given language in a forked process and send the search
+        index entries and log counts it added to the parent process.
+        """
+        search_plugin = self.i18n_configs[language]["plugins"].get("search")
+        if search_plugin:
+            entries_count = len(search_plugin.search_index._entries)
+        inherited_counts = dict(utils.log_counter.counts)
+
+        self._build_language(language, nav)
+
+        entries = []
+        if search_plugin:
+            entries = search_plugin.search_index._entries[entries_count:]
+        counts = {
+            level: count - inherited_counts.get(level, 0)
+            for level, count in utils.log_counter.counts.items()
+        }
+        connection.send((entries, counts))
+        connection.close()
+
+    def _update_search_index(self, search_plugin, languages):
+        """
+        Update the search plugin index with the given languages pages.
+        """
+        if self.default_language in languages:
+            self._fix_search_duplicates(self.default_language, search_plugin)
+        search_plugin.on_post_build(self.i18n_configs[languages[-1]])
 
-            # TODO: check if messing with site_dir wouldn't be easier than
-            # changing file dest_paths etc
-            # config["site_dir"] += "/fr"
+    def _prepare_language(self, language):
+        """
+        Build the navigation of the given language and return it once the
+        'nav' plugin events ran.
+        """
+        log.info(f"Building {language} documentation")
 
-            # Support mkdocs-material theme language
-            if config["theme"].name == "material":
-                if language in material_languages:
-                    config["theme"].language = language
-                else:
-                    log.warning(
-                        f"Language {language} is not supported by "
-                        f"mkdocs-material=={material_version}, not setting "
-                        "the 'theme.language' option"
-                    )
+        if self.i18n_configs[language]["nav"]:
+            self._fix_config_navigation(language, self.i18n_files[language])
 
-            # Run `nav` plugin events.
-            # This is useful to be compatible with nav order changing plugins
-            # such as mkdocs-awesome-pages-plugin
-            nav = config["plugins"].run_event("nav", nav, config=config, files=files)
+        self.i18n_navs[language] = get_navigation(
+            self.i18n_files[language], self.i18n_configs[language]
+        )
 
-            # Include theme specific files
-            files.add_files_from_theme(env, config)
+        config = self.i18n_configs[language]
+        files = self.i18n_files[language]
+        nav = self.i18n_navs[language]
 
-            # Include static files
-            files.copy_static_files(dirty=dirty)
+        # TODO: check if messing with site_dir wouldn't be easier than
+        # changing file dest_paths etc
+        # config["site_dir"] += "/fr"
 
-            for file in files.documentation_pages():
-                _populate_page(file.page, config, files, dirty)
+        # Support mkdocs-material theme language
+        if config["theme"].name == "material":
+            material_version, material_languages = _get_material_info()
+            if language in material_languages:
+                config["theme"].language = language
+            else:
+                log.warning(
+                    f"Language {language} is not supported by "
+                    f"mkdocs-material=={material_version}, not setting "
+                    "the 'theme.language' option"
+                )
 
-            for file in files.documentation_pages():
-                _build_page(file.page, config, files, nav, env, dirty)
+        # Run `nav` plugin events.
+        # This is useful to be compatible with nav order changing plugins
+        # such as mkdocs-awesome-pages-plugin
+        return config["plugins"].run_event("nav", nav, config=config, files=files)
 
-            # Update the search plugin index with language pages
-            if search_plugin:
-                if (
-                    language == self.default_language
-                    and self.default_language in self.config["languages"]
-                ):
-                    self._fix_search_duplicates(language, search_plugin)
-                search_plugin.on_post_build(config)
+    def _build_language(self, language, nav):
+        """
+        Build the given language documentation on its own directory.
+        """
+        dirty = False
+        config = self.i18n_configs[language]
+        env = config["theme"].get_env()
+        files = self.i18n_files[language]
+
+        # Include theme specific files
+        files.add_files_from_theme(env, config)
+
+        # Include static files
+        files.copy_static_files(dirty=dirty)
+
+        for file in files.documentation_pages():
+            _populate_page(file.page, config, files, dirty)
+
+        for file in files.documentation_pages():
+            _build_page(file.page, config, files, nav, env, dirty)
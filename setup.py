@@ -25,7 +25,10 @@ setup(
     platforms="any",
     packages=find_packages(),
     include_package_data=True,
-    install_requires=["mkdocs>=1.1.2"],
+    install_requires=[
+        "mkdocs>=1.2",
+        'importlib_metadata; python_version < "3.8"',
+    ],
     entry_points={"mkdocs.plugins": ["i18n = mkdocs_static_i18n.plugin:I18n"]},
     python_requires=">=3.6",
     classifiers=[
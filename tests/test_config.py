@@ -31,3 +31,11 @@ def test_plugin_single_language_fr():
     )
     result = plugin.on_config(config, force=True)
     assert str(result["theme"]["locale"]) == "fr"
+
+
+def test_plugin_invalid_language():
+    plugin = I18n()
+    errors, _ = plugin.load_config(
+        {"default_language": "en", "languages": {"en": "english", "fr\n": "french"}}
+    )
+    assert [name for name, _ in errors] == ["languages"]
@@ -0,0 +1,105 @@
+import logging
+import multiprocessing
+import os
+import re
+import shutil
+import time
+
+import pytest
+from mkdocs import utils
+from mkdocs.commands.build import build
+from mkdocs.config.base import load_config
+from mkdocs.exceptions import Abort
+
+
+def _read_site(site_dir):
+    site = {}
+    for root, _, files in os.walk(site_dir):
+        for name in files:
+            # the sitemaps hold the build date and time
+            if name.startswith("sitemap.xml"):
+                continue
+            path = os.path.join(root, name)
+            with open(path, "rb") as f:
+                # the build date is rendered in the html pages
+                site[os.path.relpath(path, site_dir)] = re.sub(
+                    rb"Build Date UTC : [^\n]*", b"", f.read()
+                )
+    return site
+
+
+def _build_site(site_dir, parallel_build, docs_dir="../docs/", **kwargs):
+    config = load_config(
+        "tests/mkdocs_i18n.yml", docs_dir=docs_dir, site_dir=str(site_dir), **kwargs
+    )
+    config["plugins"]["i18n"].config["parallel_build"] = parallel_build
+    build(config)
+    return config
+
+
+@pytest.fixture
+def log_counter():
+    logger = logging.getLogger("mkdocs")
+    utils.log_counter.counts.clear()
+    logger.addHandler(utils.log_counter)
+    yield utils.log_counter
+    logger.removeHandler(utils.log_counter)
+    utils.log_counter.counts.clear()
+
+
+def test_parallel_build_matches_serial_build(tmp_path, caplog):
+    _build_site(tmp_path / "serial", parallel_build=False)
+    with caplog.at_level(logging.INFO):
+        config = _build_site(tmp_path / "parallel", parallel_build=True)
+    assert "Ignoring 'parallel_build' option" not in caplog.text
+    #
+    serial_site = _read_site(tmp_path / "serial")
+    parallel_site = _read_site(tmp_path / "parallel")
+    assert os.path.join("en", "index.html") in parallel_site
+    assert os.path.join("fr", "index.html") in parallel_site
+    assert os.path.join("fr", "topic1", "named_file", "index.html") in parallel_site
+    assert parallel_site == serial_site
+    #
+    i18n_plugin = config["plugins"]["i18n"]
+    for language in ["en", "fr"]:
+        nav = i18n_plugin.i18n_navs[language]
+        assert nav.pages
+        assert all(page.file.page is page for page in nav.pages)
+        # the pages are only populated in the forked processes
+        assert all(page.content is None for page in nav.pages)
+
+
+@pytest.mark.parametrize("parallel_build", [False, True])
+def test_parallel_build_strict_warnings(tmp_path, log_counter, parallel_build):
+    docs_dir = tmp_path / "docs"
+    shutil.copytree("docs", docs_dir)
+    with open(docs_dir / "index.fr.md", "a") as f:
+        f.write("\n[broken](missing.md)\n")
+    with pytest.raises(Abort, match="1 warnings in strict mode"):
+        _build_site(
+            tmp_path / "site",
+            parallel_build=parallel_build,
+            docs_dir=str(docs_dir),
+            strict=True,
+        )
+
+
+def test_parallel_build_failure_stops_workers(tmp_path, monkeypatch):
+    config = load_config(
+        "tests/mkdocs_i18n.yml", docs_dir="../docs/", site_dir=str(tmp_path)
+    )
+    i18n_plugin = config["plugins"]["i18n"]
+    i18n_plugin.config["parallel_build"] = True
+    build_language = i18n_plugin._build_language
+
+    def _build_language(language, nav):
+        if language == "en":
+            raise RuntimeError("en build failure")
+        # keep the other worker running while the failure is handled
+        time.sleep(30)
+        build_language(language, nav)
+
+    monkeypatch.setattr(i18n_plugin, "_build_language", _build_language)
+    with pytest.raises(Abort, match="BuildError"):
+        build(config)
+    assert multiprocessing.active_children() == []
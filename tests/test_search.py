@@ -38,3 +38,11 @@ def test_search_deduplicate_entries_no_directory_urls(config_plugin_search):
     build(config)
     search_plugin = config["plugins"]["search"]
     assert len(search_plugin.search_index._entries) == 35
+
+
+def test_search_deduplicate_entries_parallel_build(config_plugin_search):
+    config = config_plugin_search
+    config["plugins"]["i18n"].config["parallel_build"] = True
+    build(config)
+    search_plugin = config["plugins"]["search"]
+    assert len(search_plugin.search_index._entries) == 33
@@ -1,6 +1,9 @@
+import os
+import shutil
 from pathlib import Path
 
 from mkdocs.commands.build import build
+from mkdocs.config.base import load_config
 
 USE_DIRECTORY_URLS = [
     Path("404.html"),
@@ -216,3 +219,24 @@ def test_plugin_no_use_directory_urls_default_language_only(
     )
     print(list(Path(site_dir).glob("**/*.html")))
     assert sorted(generate_site) == sorted(PLUGIN_NO_USE_DIRECTORY_URLS_DEFAULT_ONLY)
+
+
+def test_plugin_asset_in_dotted_directory(tmp_path):
+    docs_dir = tmp_path / "docs"
+    shutil.copytree("docs", docs_dir)
+    (docs_dir / "v1.0").mkdir()
+    shutil.copy(docs_dir / "image.en.png", docs_dir / "v1.0" / "logo.en.png")
+    shutil.copy(docs_dir / "image.fr.png", docs_dir / "v1.0" / "logo.fr.png")
+    site_dir = tmp_path / "site"
+    config = load_config(
+        "tests/mkdocs_i18n.yml", docs_dir=str(docs_dir), site_dir=str(site_dir)
+    )
+    build(config)
+    i18n_plugin = config["plugins"]["i18n"]
+    fr_logo = i18n_plugin.i18n_files["fr"].get_file_from_path(
+        os.path.join("v1.0", "logo.fr.png")
+    )
+    assert fr_logo.dest_path == os.path.join("fr", "v1.0", "logo.png")
+    assert fr_logo.url == "fr/v1.0/logo.png"
+    assert (site_dir / "fr" / "v1.0" / "logo.png").is_file()
+    assert not (site_dir / "fr" / "v1" / "logo.png").exists()
@@ -39,3 +39,14 @@ def test_urls_use_directory_urls(config_base, config_plugin):
         mkdocs_urls.add(page.url)
     plugin_urls = {p.url for p in i18n_files.documentation_pages()}
     assert mkdocs_urls == plugin_urls
+
+
+def test_urls_default_language_only(config_plugin_default_language_only):
+    config = config_plugin_default_language_only
+    i18n_plugin = config["plugins"]["i18n"]
+    #
+    i18n_plugin.on_config(config)
+    i18n_files = i18n_plugin.on_files(get_files(config), config)
+    #
+    plugin_urls = [p.url for p in i18n_files.documentation_pages()]
+    assert sorted(plugin_urls) == sorted(set(plugin_urls))